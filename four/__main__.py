@@ -3,27 +3,36 @@ Main CLI entry point.
 """
 
 # external
+import sys as _sys
 import argparse as _argparse
-
-# internal
-from four import chain, graph, infer
+import importlib as _importlib
 
 
 __all__ = [
     "parser"]
 
 
+_SUBCOMMANDS = {
+    "chain": ("four.chain", "print four-chains of target lengths"),
+    "graph": ("four.graph", "generate graphs of four-chain trees"),
+    "infer": ("four.infer", "estimate letter-efficient numbers")}
+"""
+Maps each subcommand to its module path and parser description so
+subcommand modules (and their heavy transitive imports) only load when
+actually dispatched.
+"""
+
+
 parser = _argparse.ArgumentParser(
     prog="four",
     formatter_class=_argparse.RawTextHelpFormatter,
     description="generate 4-chains")
 commands = parser.add_subparsers(metavar='SUBCOMMAND')
-for module in (chain, graph, infer):
+for name, (_, description) in _SUBCOMMANDS.items():
     commands.add_parser(
-        module.parser.prog,
-        parents=[module.parser],
+        name,
         formatter_class=_argparse.RawTextHelpFormatter,
-        help=module.parser.description,
+        help=description,
         add_help=False)
 
 
@@ -31,8 +40,19 @@ def _four():
     """
     Main entry point for four CLI.
     """
-    # call func with parsed args
-    inputs = vars(parser.parse_args())
+    arguments = _sys.argv[1:]
+    if arguments and arguments[0] in _SUBCOMMANDS:
+        # import and parse with only the chosen subcommand's module;
+        # its parser names itself after the module for direct use, so
+        # restore the "four <subcommand>" prog for help/error text
+        module = _importlib.import_module(_SUBCOMMANDS[arguments[0]][0])
+        module.parser.prog = f"four {arguments[0]}"
+        inputs = vars(module.parser.parse_args(arguments[1:]))
+        inputs.pop('func', module.parser.print_help)(**inputs) # noqa
+        return
+
+    # fall through for top-level help text and error messages
+    inputs = vars(parser.parse_args(arguments))
     inputs.pop('func', parser.print_help)(**inputs) # noqa
 
 
@@ -7,16 +7,23 @@ from typing import Any, Tuple, Generator
 
 # external
 import re as _re
-import math as _math
+import functools as _functools
+import itertools as _itertools
+from conwech import lexicon as _lexicon
 
 
 __all__ = [
     "PERIOD_PATTERN",
+    "PERIOD_STRINGS",
+    "PERIOD_VALUE_LETTERS",
+    "ZILLION_PREFIX_LENGTHS",
     "KEY_PERIOD_VALUES",
     "KEY_PERIOD_EXCEPTIONS",
+    "iter_abbreviation",
     "rebase",
     "occurs",
     "letters",
+    "letters_in_name_range",
     "status"]
 
 
@@ -68,6 +75,17 @@ Examples:
 """
 
 
+PERIOD_STRINGS = tuple(f"{period:03d}" for period in range(1000))
+"""
+Zero-padded 3-character strings for every period value in [0, 1000),
+so formatting a period is an O(1) tuple index.
+
+Examples:
+    >>> PERIOD_STRINGS[4]
+    '004'
+"""
+
+
 KEY_PERIOD_VALUES = {
     3:  1,    # one
     4:  4,    # four
@@ -116,6 +134,68 @@ Exceptions to KEY_PERIOD_VALUES for numbers with more than two periods.
 """
 
 
+def iter_abbreviation(
+        abbreviation: str
+) -> Generator[Tuple[int, int], None, None]:
+    """
+    Tokenize a period-list string into (P, R) tuples.
+
+    Implements the same grammar as PERIOD_PATTERN with a single
+    left-to-right scan instead of lookaround-heavy regex matching: a
+    repetition like "[P]{R}" yields (P, R), while each bare 3-digit
+    period yields (P, 1). Only the very first period in the string may
+    have fewer than 3 digits.
+
+    Args:
+        abbreviation: A pseudo-numeric string in which repeated periods
+            are represented like "[P]{R}" where P is the period value
+            and R is the number of times the period is repeated.
+
+    Yields:
+        Tuple[int, int]: Each (P, R) tuple parsed from abbreviation in
+        order of appearance; consecutive equal periods are not merged.
+
+    Raises:
+        ValueError: When abbreviation is improperly formatted.
+
+    Examples:
+        >>> list(iter_abbreviation("12345[678]{9}000"))
+        [(12, 1), (345, 1), (678, 9), (0, 1)]
+
+    See Also:
+        - :attr:`PERIOD_PATTERN`
+    """
+    index, length = 0, len(abbreviation)
+    while index < length:
+        if abbreviation[index] == "[":
+            # repetition like "[ddd]{R}"
+            closing = abbreviation.find("]{", index + 1)
+            brace = abbreviation.find("}", closing + 2) if closing > 0 else -1
+            period = abbreviation[index + 1:closing]
+            repeat = abbreviation[closing + 2:brace] if brace > 0 else ""
+            if len(period) != 3 or not period.isdigit() or not repeat.isdigit():
+                raise ValueError(
+                    f"invalid abbreviation segment: '{abbreviation[index:]}'")
+            yield int(period), int(repeat)
+            index = brace + 1
+        else:
+            # a run of bare digits; only the very first period in the
+            # string may have fewer than 3 digits
+            run = index
+            while run < length and abbreviation[run].isdigit():
+                run += 1
+            digits = run - index
+            if digits == 0 or (index > 0 and digits % 3 != 0):
+                raise ValueError(
+                    f"invalid abbreviation segment:"
+                    f" '{abbreviation[run - digits % 3:]}'")
+            width = (digits % 3 or 3) if index == 0 else 3
+            while index < run:
+                yield int(abbreviation[index:index + width]), 1
+                index += width
+                width = 3
+
+
 def rebase(decimal: int, base: int) -> Generator[Tuple[int, int], None, None]:
     """
     Get a tuple representation of decimal in the specified base.
@@ -142,10 +222,19 @@ def rebase(decimal: int, base: int) -> Generator[Tuple[int, int], None, None]:
         >>> list(rebase(123456789, 1000))
         [(123, 2), (456, 1), (789, 0)]
     """
-    digits = _math.floor(_math.log(abs(decimal) or 1, base))
-    yield from (
-        ((decimal // base**power) % base, power)
-        for power in range(digits, -1, -1))
+    decimal = abs(int(decimal))
+    if decimal == 0:
+        yield 0, 0
+        return
+
+    digits = []
+    power = 0
+    while decimal:
+        decimal, coefficient = divmod(decimal, base)
+        digits.append((coefficient, power))
+        power += 1
+
+    yield from reversed(digits)
 
 
 def occurs(digit: int, limit: int, start: int = 0, base: int = 10) -> int:
@@ -188,53 +277,59 @@ def occurs(digit: int, limit: int, start: int = 0, base: int = 10) -> int:
     if 0 < start < limit:
         return occurs(digit, limit, 0, base) - occurs(digit, start, 0, base)
 
-    # count = 0 if digit != 0 else 1
-    # for coefficient, power in rebase(limit, base):
-    #     power_of_base = base ** power
-    #     count += power_of_base * (limit // base ** (power + 1))
-    #     if coefficient > digit > 0:
-    #         count += power_of_base
-    #     elif coefficient == digit:
-    #         count += limit % power_of_base
-    #
-    # return count
-
+    # consume digits least-significant first with running power and
+    # remainder so no base**power is ever recomputed; after each divmod
+    # remaining == limit // base**(power + 1) and
+    # remainder == limit % base**power
     count = 0 if digit != 0 else 1
-    for coefficient, power in rebase(limit, base):
-        power_of_base = base ** power
-        count += power_of_base * (limit // base ** (power + 1))
+    remaining = limit
+    power_of_base = 1
+    remainder = 0
+    while remaining:
+        remaining, coefficient = divmod(remaining, base)
+        count += power_of_base * remaining
         if digit < coefficient:
             count += power_of_base
         if digit == coefficient:
-            count += limit % power_of_base
+            count += remainder
         if digit == 0:
             count -= power_of_base
+        remainder += coefficient * power_of_base
+        power_of_base *= base
 
     return count
 
-    # return sum((
-    #     sum((
-    #         base**power * (limit // base**(power+1)),
-    #         base**power if coefficient > digit else 0,
-    #         limit % base**power if coefficient == digit else 0,
-    #         -1 * base**power if digit == 0 else 0
-    #     )) for coefficient, power in rebase(limit, base)
-    # )) + (1 if digit == 0 else 0)
-
 
 def count(digit, limit, position=None):
-    import re
-    total = 0
     if position is None:
-        for num in range(limit):
-            total += len(list(re.finditer(str(digit), str(num))))
-    else:
-        for num in range(limit):
-            if str(num).zfill(len(str(limit)))[position-1] == str(digit):
-                total += 1
+        return occurs(digit, limit)
+
+    # position counts from the left with numbers zero-padded to the
+    # width of limit, so it maps to a single power of 10
+    power = 10 ** (len(str(limit)) - position)
+    total = power * (limit // (power * 10))
+    coefficient = (limit // power) % 10
+    if digit < coefficient:
+        total += power
+    if digit == coefficient:
+        total += limit % power
     return total
 
 
+_NON_LETTERS = "".join(
+    chr(point) for point in range(256)
+    if not (65 <= point <= 90 or 97 <= point <= 122))
+"""
+Every non-letter character in the latin-1 range.
+"""
+
+
+_DELETE_NON_LETTERS = str.maketrans("", "", _NON_LETTERS)
+"""
+Translation table which deletes every character in _NON_LETTERS.
+"""
+
+
 def letters(string: str) -> int:
     """
     Get the number of letters in the given string.
@@ -249,7 +344,95 @@ def letters(string: str) -> int:
         >>> letters("hello world!")
         10
     """
-    return len(_re.findall(r"[a-zA-Z]", string))
+    return len(string.translate(_DELETE_NON_LETTERS))
+
+
+PERIOD_VALUE_LETTERS = tuple(
+    letters(numeral) for numeral in _lexicon.NATURAL_NUMBERS_LT_1000)
+"""
+Number of letters in the numeral for each period value in [0, 1000).
+
+Examples:
+    >>> PERIOD_VALUE_LETTERS[373]
+    24
+"""
+
+
+ZILLION_PREFIX_LENGTHS = tuple(
+    len(f"{prefix}illi") for prefix in _lexicon.ZILLION_PERIOD_PREFIXES)
+"""
+Length of each zillion period prefix including the "illi" suffix.
+
+Examples:
+    >>> ZILLION_PREFIX_LENGTHS[1]
+    5
+"""
+
+
+_PREFIX_LENGTHS_TOTAL = sum(ZILLION_PREFIX_LENGTHS)
+"""
+Sum of every entry in ZILLION_PREFIX_LENGTHS.
+"""
+
+
+_PREFIX_LENGTHS_CUMSUM = tuple(
+    _itertools.accumulate(ZILLION_PREFIX_LENGTHS, initial=0))
+"""
+Cumulative sums of ZILLION_PREFIX_LENGTHS; entry p is
+sum(ZILLION_PREFIX_LENGTHS[:p]).
+"""
+
+
+@_functools.lru_cache(maxsize=1024)
+def _sum_prefix_lengths_below(limit: int) -> int:
+    """
+    Sum period prefix lengths over every period of every zillion value
+    in the range [0, limit).
+
+    Equivalent to weighting occurs(period, limit, base=1000) by
+    ZILLION_PREFIX_LENGTHS[period] and summing over all 1000 period
+    values, but computed in a single pass over limit's base-1000 digits
+    rather than 1000 separate occurs calls.
+
+    Args:
+        limit (int): The upper limit of the range (exclusive).
+
+    Returns:
+        int: The total prefix length over the given range.
+    """
+    if limit <= 0:
+        return 0
+
+    total = ZILLION_PREFIX_LENGTHS[0]
+    for coefficient, power in rebase(limit, 1000):
+        power_of_base = 1000 ** power
+        total += sum((
+            _PREFIX_LENGTHS_TOTAL * power_of_base * (limit // (power_of_base * 1000)),
+            _PREFIX_LENGTHS_CUMSUM[coefficient] * power_of_base,
+            ZILLION_PREFIX_LENGTHS[coefficient] * (limit % power_of_base),
+            -1 * ZILLION_PREFIX_LENGTHS[0] * power_of_base))
+
+    return total
+
+
+def letters_in_name_range(min_z: int, max_z: int) -> int:
+    """
+    Count the letters in every period name with a zillion value in the
+    range [max(0, min_z), max_z].
+
+    Args:
+        min_z (int): The lower zillion limit (exclusive).
+        max_z (int): The upper zillion limit (inclusive).
+
+    Returns:
+        int: The number of letters over the given range of names.
+    """
+    total = (max_z - max(0, min_z)) * len("on")
+    total += (_sum_prefix_lengths_below(max_z)
+              - _sum_prefix_lengths_below(max(0, min_z)))
+    if min_z <= 0 < max_z:
+        total += len("thousand") - len("nillion")
+    return total
 
 
 def status(number: Any, letters: Any, **kwargs) -> None:
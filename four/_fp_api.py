@@ -7,18 +7,19 @@ algorithm.
 from typing import Union, Tuple, List, Sequence
 
 # external
-import re as _re
 import math as _math
+import numpy as _numpy
 import functools as _functools
-from conwech import lexicon as _lexicon
 
 # internal
 from four._core import (
-    PERIOD_PATTERN as _PERIOD_PATTERN,
+    PERIOD_STRINGS as _PERIOD_STRINGS,
+    PERIOD_VALUE_LETTERS as _PERIOD_VALUE_LETTERS,
     KEY_PERIOD_VALUES as _KEY_PERIOD_VALUES,
     KEY_PERIOD_EXCEPTIONS as _KEY_PERIOD_EXCEPTIONS,
+    iter_abbreviation as _iter_abbreviation,
+    letters_in_name_range as _letters_from_names_in_range,
     rebase as _rebase,
-    occurs as _occurs,
     status as _status)
 
 
@@ -38,6 +39,75 @@ Determines how verbose CLI output is for _number_from_name_length.
 """
 
 
+_PERIOD_VALUE_LETTERS_NP = _numpy.asarray(
+    _PERIOD_VALUE_LETTERS, dtype=_numpy.int64)
+"""
+Contiguous int64 mirror of _PERIOD_VALUE_LETTERS for vectorized
+fancy-indexed lookups over long period-lists.
+"""
+
+
+_exact_quotient_predictions = None
+"""
+Lazy memoized binding for four.infer.exact_quotient_predictions; the
+import is deferred until first use to avoid a circular import.
+"""
+
+
+def _predict_num_periods(target_length_periods: int) -> int:
+    """
+    Predict the number of periods in the smallest number with a name
+    containing target_length_periods periods worth of letters.
+
+    Args:
+        target_length_periods: The number of periods in the target name
+            length.
+
+    Returns:
+        The predicted number of periods.
+
+    See Also:
+        - :func:`four.infer.exact_quotient_predictions`
+    """
+    global _exact_quotient_predictions
+    if _exact_quotient_predictions is None:
+        from four.infer import exact_quotient_predictions
+        _exact_quotient_predictions = _functools.lru_cache(maxsize=1024)(
+            exact_quotient_predictions)
+
+    prediction, = _exact_quotient_predictions((target_length_periods, ))
+    return prediction
+
+
+@_functools.lru_cache(maxsize=4096)
+def _letters_cached(number: Tuple[Tuple[int, int], ...]) -> int:
+    """
+    Memoized core of letters_in_number_name over hashable
+    period-tuples.
+
+    Args:
+        number: A tuple of (P, R) tuples representing a number.
+
+    Returns:
+        The number of letters in number's numeral.
+    """
+    # fused single pass over number accumulating both the value letters
+    # and the missing name letters from zero-valued periods
+    values = 0
+    zillion, missing = -1, 0
+    for period, repeat in reversed(number):
+        zillion += repeat
+        values += repeat * _PERIOD_VALUE_LETTERS[period]
+        if period == 0:
+            missing += _letters_from_names_in_range(zillion - repeat, zillion)
+
+    # only zero-valued periods contribute no value letters
+    if values == 0:
+        values = len("zero")
+
+    return values + _letters_from_names_in_range(0, zillion) - missing
+
+
 def _first(
         target: Union[int, str, Sequence[Tuple[int, int]]]
 ) -> List[Tuple[int, int]]:
@@ -76,9 +146,8 @@ def _first(
     # defined once for reuse in _letters function
     _end = "\n" if _cli_verbosity > 2 else "\r"
 
-    @_functools.wraps(letters_in_number_name)
     def _letters(number: Sequence[Tuple[int, int]]):
-        letters = letters_in_number_name(number)
+        letters = _letters_cached(tuple(number))
         if _cli_verbosity > 1:
             _status(
                 write_abbreviation(number),
@@ -86,14 +155,19 @@ def _first(
                 end=_end)
         return letters
 
-    # delayed to avoid circular import
-    from four.infer import exact_quotient_predictions
-    n_max, = exact_quotient_predictions([
-        sum(repeat for _, repeat in number_to_periods(target)), ])
-    while _letters([(373, n_max), ]) < target:
-        n_max *= 2
+    n_max = _predict_num_periods(
+        sum(repeat for _, repeat in number_to_periods(target)))
 
+    # scale the estimate by the ratio of target to actual letters
+    # rather than doubling blindly; letters grow superlinearly in the
+    # repeat count, so each rescale lands at or just above the root
     n_min = 1
+    while _letters([(373, n_max), ]) < target:
+        n_min = n_max
+        n_max = max(
+            n_max + 1,
+            n_max * target // _letters([(373, n_max), ]))
+
     while not (_letters([(373, n_max - 1), ])
                < target <=
                _letters([(373, n_max), ])):
@@ -121,8 +195,8 @@ def _first(
 
     return [
         (period, repeat)
-        for period, repeat
-        in [*min_periods, *mid_periods, *max_periods]
+        for periods in (min_periods, mid_periods, max_periods)
+        for period, repeat in periods
         if repeat > 0]
 
 
@@ -179,10 +253,12 @@ def periods_to_number(periods: Sequence[Tuple[int, int]]) -> int:
     See Also:
         - :func:`number_to_periods`
     """
-    return int("".join(
-        str(period).zfill(3) * repeat
-        for period, repeat in periods
-    ) or 0)
+    number = 0
+    for period, repeat in periods:
+        power = 1000 ** repeat
+        # (1000**repeat - 1) // 999 is repeat periods of 001
+        number = number * power + int(period) * ((power - 1) // 999)
+    return number
 
 
 def parse_abbreviation(abbreviation: str) -> List[Tuple[int, int]]:
@@ -211,15 +287,7 @@ def parse_abbreviation(abbreviation: str) -> List[Tuple[int, int]]:
         - :attr:`four._core.PERIOD_PATTERN`
     """
     periods = []
-
-    for match in _PERIOD_PATTERN.finditer(abbreviation):
-        period, repeat, error = match.groups()
-
-        if error is not None:
-            raise ValueError(f"invalid abbreviation segment: '{error}'")
-
-        period = int(period)
-        repeat = int(repeat or 1)
+    for period, repeat in _iter_abbreviation(abbreviation):
         if periods and period == periods[-1][0]:
             periods[-1] = (periods[-1][0], periods[-1][1] + repeat)
         else:
@@ -250,10 +318,22 @@ def write_abbreviation(number: Sequence[Tuple[int, int]]) -> str:
         - :func:`parse_abbreviation`
         - :attr:`four._core.PERIOD_PATTERN`
     """
-    return "".join(
-        f"[{period:0>3}]{{{repeat}}}" if repeat > 1
-        else f"{period:0>3}" if repeat > 0 else ""
-        for period, repeat in number).lstrip("0") or "0"
+    # strip leading zeros while emitting segments instead of copying
+    # the joined string with lstrip afterwards
+    parts = []
+    stripping = True
+    for period, repeat in number:
+        if repeat > 1:
+            parts.append(f"[{_PERIOD_STRINGS[period]}]{{{repeat}}}")
+            stripping = False
+        elif repeat > 0:
+            if not stripping:
+                parts.append(_PERIOD_STRINGS[period])
+            elif period:
+                parts.append(str(period))
+                stripping = False
+
+    return "".join(parts) or "0"
 
 
 def letters_in_period_values(number: Sequence[Tuple[int, int]]) -> int:
@@ -274,12 +354,29 @@ def letters_in_period_values(number: Sequence[Tuple[int, int]]) -> int:
         >>> letters_in_period_values([(1, 3), ])
         9
     """
-    if all([int(period) == 0 for period, _ in number]):
+    if len(number) >= 32:
+        try:
+            repeats = _numpy.fromiter(
+                (repeat for _, repeat in number),
+                dtype=_numpy.int64, count=len(number))
+        except OverflowError:
+            # a repeat too large for int64; take the scalar path
+            pass
+        else:
+            # keep the dot product comfortably below int64 wraparound
+            if int(repeats.max(initial=0)) << repeats.size.bit_length() < 1 << 56:
+                periods = _numpy.fromiter(
+                    (period for period, _ in number),
+                    dtype=_numpy.int64, count=len(number))
+                if not periods.any():
+                    return len("zero")
+                return int(repeats @ _PERIOD_VALUE_LETTERS_NP[periods])
+
+    if all(period == 0 for period, _ in number):
         return len("zero")
 
     return sum((
-        repeat * len(_re.findall(
-            r"[a-zA-Z]", _lexicon.NATURAL_NUMBERS_LT_1000[int(period)]))
+        repeat * _PERIOD_VALUE_LETTERS[period]
         for period, repeat in number))
 
 
@@ -301,30 +398,13 @@ def letters_in_period_names(number: Sequence[Tuple[int, int]]) -> int:
         >>> letters_in_period_names([(1, 3), ])
         15
     """
-    prefix_lengths = [
-        len(f"{prefix}illi") for prefix in _lexicon.ZILLION_PERIOD_PREFIXES]
-
-    def from_names_in_range(min_z, max_z):
-        # return sum([
-        #     sum((_occurs(period, max_z, max(0, min_z), base=1000)
-        #          * prefix_lengths[period]
-        #          for period in range(1000))),
-        #     (max_z - max(0, min_z)) * len("on"),
-        #     len("thousand") - len("nillion") if min_z <= 0 < max_z else 0])
-        total = (max_z - max(0, min_z)) * len("on")
-        for period in range(1000):
-            total += _occurs(period, max_z, max(0, min_z), base=1000) * prefix_lengths[period]
-        if min_z <= 0 < max_z:
-            total += len("thousand") - len("nillion")
-        return total
-
     zillion, missing = -1, 0
-    for period, repeat in number[::-1]:
+    for period, repeat in reversed(number):
         zillion += repeat
-        if int(period) == 0:
-            missing += from_names_in_range(zillion - repeat, zillion)
+        if period == 0:
+            missing += _letters_from_names_in_range(zillion - repeat, zillion)
 
-    return from_names_in_range(0, zillion) - missing
+    return _letters_from_names_in_range(0, zillion) - missing
 
 
 def letters_in_number_name(number: Sequence[Tuple[int, int]]) -> int:
@@ -348,4 +428,7 @@ def letters_in_number_name(number: Sequence[Tuple[int, int]]) -> int:
         - :func:`letters_in_period_values`
         - :func:`letters_in_period_names`
     """
-    return letters_in_period_values(number) + letters_in_period_names(number)
+    # canonicalize to the hashable tuple form so results are shared
+    # with every other caller of the cached core
+    return _letters_cached(tuple(
+        (period, repeat) for period, repeat in number))
@@ -6,18 +6,19 @@ Object-oriented approach to the 4-chain search algorithm.
 from typing import Union, Tuple, Iterable, Generator
 
 # external
+from bisect import insort as _insort
+from weakref import ref as _ref
 from warnings import warn as _warn
-from itertools import cycle as _cycle
-from conwech import lexicon as _lexicon
 
 # internal
 from four._core import (
-    PERIOD_PATTERN as _PERIOD_PATTERN,
+    PERIOD_STRINGS as _PERIOD_STRINGS,
+    PERIOD_VALUE_LETTERS as _PERIOD_VALUE_LETTERS,
     KEY_PERIOD_VALUES as _KEY_PERIOD_VALUES,
     KEY_PERIOD_EXCEPTIONS as _KEY_PERIOD_EXCEPTIONS,
+    iter_abbreviation as _iter_abbreviation,
+    letters_in_name_range as _letters_in_name_range,
     rebase as _rebase,
-    occurs as _occurs,
-    letters as _letters,
     status as _status)
 
 
@@ -38,28 +39,47 @@ Determines how verbose CLI output is for _number_from_name_length.
 """
 
 
+def _build_next_same_letters() -> Tuple[int, ...]:
+    """
+    Build a table mapping each period value to the next greater period
+    value whose numeral has the same number of letters (-1 when no such
+    value exists).
+    """
+    table = [-1] * 1000
+    latest = {}
+    for value in range(999, -1, -1):
+        table[value] = latest.get(_PERIOD_VALUE_LETTERS[value], -1)
+        latest[_PERIOD_VALUE_LETTERS[value]] = value
+    return tuple(table)
+
+
+_NEXT_SAME_LETTERS = _build_next_same_letters()
+"""
+The next greater period value with the same number of letters in its
+numeral for each period value in [0, 1000); -1 where none exists.
+"""
+
+
 def C(length: int = 1, chain_index: int = 1): # noqa
     """"""
     this_rank = [[PNumber(4)]]
     while any(len(c) < length for c in this_rank):
+        # next_rank holds (key, chain) tuples kept sorted by the
+        # chain's newest PNumber so each insertion is a binary search
+        # instead of a linear scan of every chain already placed
         next_rank = []
         for this_chain in this_rank:
             count = 0
             child = _first(this_chain[-1])
             while child is not None and count < chain_index:
-                index = 0
-                for next_chain in next_rank:
-                    if child < next_chain[-1]:
-                        break
-                    index += 1
-                next_rank.insert(index, [*this_chain, child])
+                _insort(next_rank, (child, [*this_chain, child]))
                 child = _next(child)
                 count += 1
         if len(next_rank) == 0:
             for this_chain in this_rank:
                 child = _next(this_chain[-1])
-                next_rank.append([*this_chain[:-1], child])
-        this_rank = next_rank[:chain_index]
+                next_rank.append((child, [*this_chain[:-1], child]))
+        this_rank = [chain for _, chain in next_rank[:chain_index]]
 
     if len(this_rank) < chain_index:
         raise IndexError(f"C[{length}][{chain_index}] does not exist!")
@@ -98,8 +118,8 @@ def _first(target: PNumberLike) -> Union['PNumber', None]:
     # defined once for reuse in _letters function
     _end = "\n" if _cli_verbosity > 2 else "\r"
 
-    def _letters(number: PNumber):
-        letters = number.name_length
+    def _letters(number: PNumber) -> int:
+        letters = number.name_length_int
         if _cli_verbosity > 1:
             _status(number, letters, end=_end)
         return letters
@@ -108,22 +128,33 @@ def _first(target: PNumberLike) -> Union['PNumber', None]:
     from four.infer import exact_quotient_predictions as predictor
     target_number_periods, = predictor([target.num_periods, ])
     r_periods = PNumber([(373, target_number_periods), ])
-    while _letters(r_periods) < target:
-        r_periods[0].repeat *= 2
 
-    l_periods = PNumber(373)
+    # scale the estimate by the ratio of target to actual letters
+    # rather than doubling blindly; letters grow superlinearly in the
+    # repeat count, so each rescale lands at or just above the root
+    target_letters = int(target)
+    l_repeat = 1
+    while _letters(r_periods) < target_letters:
+        l_repeat = r_periods[0].repeat
+        r_periods[0].repeat = max(
+            l_repeat + 1,
+            l_repeat * target_letters // r_periods.name_length_int)
+
+    l_periods = PNumber([(373, l_repeat), ])
     m_periods = PNumber(373)
     r_oneless = PNumber([(373, r_periods[0].repeat - 1), ])
-    while not (r_oneless.name_length < target <= r_periods.name_length):
+    while not (r_oneless.name_length_int
+               < target_letters <=
+               r_periods.name_length_int):
         m_periods[0].repeat = (l_periods[0].repeat + r_periods[0].repeat) // 2
-        if _letters(m_periods) < target:
+        if _letters(m_periods) < target_letters:
             l_periods[0].repeat = m_periods[0].repeat
         else:
             r_periods[0].repeat = m_periods[0].repeat
             r_oneless[0].repeat = r_periods[0].repeat - 1
 
     periods = PNumber(r_periods)
-    while _letters(periods) > target:
+    while _letters(periods) > target_letters:
         periods.prepend((1, 1))
         periods[-1].repeat -= 1
 
@@ -131,7 +162,7 @@ def _first(target: PNumberLike) -> Union['PNumber', None]:
     periods.insert(1, (0, 1))
     for length, period in _KEY_PERIOD_VALUES.items():
         periods[1].value = period
-        if _letters(periods) == target:
+        if _letters(periods) == target_letters:
             break
 
     if periods[-1].repeat > 0 and periods[1].value in _KEY_PERIOD_EXCEPTIONS.keys():
@@ -139,7 +170,9 @@ def _first(target: PNumberLike) -> Union['PNumber', None]:
         periods.insert(2, (323, 1))
         periods[-1].repeat -= 1
 
-    return PNumber(str(periods))
+    # copy structurally, dropping exhausted runs, instead of
+    # round-tripping through str() and the period parser
+    return PNumber([period for period in periods if period.repeat])
 
 
 def _next(node: PNumberLike) -> Union['PNumber', None]:
@@ -150,16 +183,11 @@ def _next(node: PNumberLike) -> Union['PNumber', None]:
         return PNumber(5)
 
     lsp_value = node[-1].value
-    lsp_length = _letters(_lexicon.NATURAL_NUMBERS_LT_1000[lsp_value])
-    new_value = next(
-        (period for period, numeral
-         in enumerate(
-            _lexicon.NATURAL_NUMBERS_LT_1000[lsp_value + 1:],
-            start=lsp_value + 1)
-         if _letters(numeral) == lsp_length),
-        None)
-
-    result = PNumber(str(node))
+    new_value = _NEXT_SAME_LETTERS[lsp_value]
+    if new_value < 0:
+        new_value = None
+
+    result = node.copy()
     if new_value is None:
         # todo...
         return None
@@ -257,10 +285,20 @@ class PNumber(list):
         """
         super().__init__()
         self.debug = bool(debug)
-        if isinstance(number, int):
-            self.extend(PNumber._iter_periods_from_int(number))
+        self._num_periods_cache = None
+        self._name_length_cache = None
+        if type(number) is PNumber:
+            # an existing PNumber is already validated and compressed;
+            # duplicate its runs without the __setitem__ machinery
+            owner = _ref(self)
+            for period in number:
+                duplicate = RPeriod._unchecked_new(period.value, period.repeat)
+                duplicate._owner = owner
+                list.append(self, duplicate)
+        elif isinstance(number, int):
+            self._extend_trusted(PNumber._iter_periods_from_int(number))
         elif isinstance(number, str):
-            self.extend(PNumber._iter_periods_from_str(number))
+            self._extend_trusted(PNumber._iter_periods_from_str(number))
         elif number is not None:
             self.extend(number)
 
@@ -282,7 +320,7 @@ class PNumber(list):
             raise TypeError(f"number must be of type {int}!")
 
         yield from (
-            RPeriod(period, 1)
+            RPeriod._unchecked_new(period, 1)
             for period, _ in _rebase(number, 1000))
 
     @staticmethod
@@ -306,18 +344,42 @@ class PNumber(list):
         if not isinstance(number, str):
             raise TypeError(f"number must be of type {str}!")
 
-        for match in _PERIOD_PATTERN.finditer(number):
-            period, repeat, error = match.groups()
-            if error is not None:
-                raise ValueError(f"invalid string segment: '{error}'")
-            yield RPeriod(int(period), int(repeat or 1))
+        yield from (
+            RPeriod._unchecked_new(period, repeat)
+            for period, repeat in _iter_abbreviation(number))
+
+    def _extend_trusted(self, periods: Iterable['RPeriod']) -> None:
+        """
+        Adopt freshly-constructed RPeriods without the re-wrapping and
+        re-validation __setitem__ performs; for the internal generators
+        whose output nothing else holds a reference to.
+
+        Args:
+            periods: An iterable of newly-built RPeriods.
+        """
+        owner = _ref(self)
+        for period in periods:
+            period._owner = owner
+            list.append(self, period)
+        self._invalidate()
+        self._compress()
+
+    def _invalidate(self) -> None:
+        """
+        Housekeeping method dropping cached attributes; called on every
+        mutation, including RPeriod value/repeat updates.
+        """
+        self._num_periods_cache = None
+        self._name_length_cache = None
 
     @property
     def num_periods(self) -> int:
         """
         The number of periods in this PNumber.
         """
-        return max(0, sum((repeat for _, repeat in self)))
+        if self._num_periods_cache is None:
+            self._num_periods_cache = max(0, sum((repeat for _, repeat in self)))
+        return self._num_periods_cache
 
     @property
     def zillion(self) -> int:
@@ -326,12 +388,21 @@ class PNumber(list):
         """
         return self.num_periods - 1
 
+    @property
+    def name_length_int(self) -> int:
+        """
+        Number of letters in this PNumber's name as a plain int.
+        """
+        if self._name_length_cache is None:
+            self._name_length_cache = self._value_letters + self._name_letters
+        return self._name_length_cache
+
     @property
     def name_length(self) -> 'PNumber':
         """
         Number of letters in this PNumber's name.
         """
-        return PNumber(self._value_letters + self._name_letters)
+        return PNumber(self.name_length_int)
 
     @property
     def _value_letters(self) -> int:
@@ -343,7 +414,7 @@ class PNumber(list):
         if all([period.value == 0 for period in self]):
             return len("zero")
         return sum((
-            repeat * _letters(_lexicon.NATURAL_NUMBERS_LT_1000[value])
+            repeat * _PERIOD_VALUE_LETTERS[value]
             for value, repeat in self))
 
     @property
@@ -354,26 +425,14 @@ class PNumber(list):
         if self.zillion < 0:
             return 0
 
-        prefix_lengths = [
-            len(f"{prefix}illi")
-            for prefix in _lexicon.ZILLION_PERIOD_PREFIXES]
-
-        def _from_names_in_range(min_z, max_z):
-            return sum([
-                sum((_occurs(period, max_z, max(0, min_z), base=1000)
-                     * prefix_lengths[period]
-                     for period in range(1000))),
-                (max_z - max(0, min_z)) * len("on"),
-                len("thousand") - len("nillion") if min_z <= 0 < max_z else 0])
-
         zillion, missing = -1, 0
-        for period in self[::-1]:
+        for period in reversed(self):
             zillion += period.repeat
             if period.value == 0:
-                missing += _from_names_in_range(
+                missing += _letters_in_name_range(
                     zillion - period.repeat, zillion)
 
-        return _from_names_in_range(0, zillion) - missing
+        return _letters_in_name_range(0, zillion) - missing
 
     def __setitem__(
             self, index: Union[int, slice],
@@ -382,20 +441,43 @@ class PNumber(list):
             index = slice(index, index + 1)
             periods = [periods, ]
 
-        periods = [RPeriod(period) for period in periods]
+        # existing RPeriods are already validated; copy them without
+        # re-running the property checks
+        periods = [
+            RPeriod._unchecked_new(period.value, period.repeat)
+            if isinstance(period, RPeriod) else RPeriod(period)
+            for period in periods]
+        for period in periods:
+            period._owner = _ref(self)
 
         super().__setitem__(index, periods)
+        self._invalidate()
         self._compress()
 
     def __delitem__(self, index: Union[int, slice]) -> None:
         super().__delitem__(index)
+        self._invalidate()
         self._compress()
 
     def __int__(self) -> int:
         return self.approximate(self.num_periods)
 
     def __str__(self) -> str:
-        return ''.join(str(period) for period in self).lstrip('0')
+        # strip leading zeros while emitting segments instead of
+        # joining every period's string and lstripping the copy
+        parts = []
+        stripping = True
+        for period in self:
+            if period.repeat == 1:
+                if not stripping:
+                    parts.append(_PERIOD_STRINGS[period.value])
+                elif period.value:
+                    parts.append(str(period.value))
+                    stripping = False
+            elif period.repeat > 1:
+                parts.append(str(period))
+                stripping = False
+        return ''.join(parts)
 
     def __eq__(self, other: PNumberLike) -> bool:
         return self._compare(other) == 0
@@ -415,7 +497,7 @@ class PNumber(list):
     def __ge__(self, other: PNumberLike) -> bool:
         return self._compare(other) >= 0
 
-    def _compare(self, other: PNumberLike) -> Union[int, float]:
+    def _compare(self, other: PNumberLike) -> int:
         """
         Compare two PNumber objects.
 
@@ -426,35 +508,63 @@ class PNumber(list):
             An integer; negative when self < other, positive when
                 self > other, and 0 when self == other.
         """
-        other = PNumber(other)
-        if str(self) == str(other):
-            return 0
+        if type(other) is int and 0 <= other < len(_SMALL_PNUMBERS):
+            # the guard clauses in _first/_last compare against small
+            # int literals on every call; reuse interned equivalents
+            other = _SMALL_PNUMBERS[other]
+        elif not isinstance(other, PNumber):
+            other = PNumber(other)
 
         difference = self.zillion - other.zillion
         if difference != 0:
-            return difference / abs(difference)
-
-        periods = zip(_cycle(self), _cycle(other))
-        for slf, oth in periods:
-            difference = slf.value - oth.value
-            if difference != 0:
-                return difference
-            if slf.repeat < oth.repeat:
-                return next(periods, [slf, oth])[0].value - oth.value
-            if slf.repeat > oth.repeat:
-                return slf.value - next(periods, [slf, oth])[1].value
+            return -1 if difference < 0 else 1
+
+        # single-run numbers are the common case in C()'s insertions;
+        # equal zillions mean equal repeats, so only values can differ
+        if len(self) == 1 and len(other) == 1:
+            difference = self[0].value - other[0].value
+            return 0 if difference == 0 else (-1 if difference < 0 else 1)
+
+        # walk both run-length encodings most-significant first,
+        # consuming the overlap of the current runs at each step; equal
+        # zillions guarantee both sides exhaust on the same step
+        runs_self = [(period.value, period.repeat) for period in self if period.repeat]
+        runs_other = [(period.value, period.repeat) for period in other if period.repeat]
+        index_self = index_other = 0
+        value_self = remain_self = value_other = remain_other = 0
+        while True:
+            if remain_self == 0:
+                if index_self == len(runs_self):
+                    return 0
+                value_self, remain_self = runs_self[index_self]
+                index_self += 1
+            if remain_other == 0:
+                value_other, remain_other = runs_other[index_other]
+                index_other += 1
+            if value_self != value_other:
+                return -1 if value_self < value_other else 1
+            overlap = min(remain_self, remain_other)
+            remain_self -= overlap
+            remain_other -= overlap
 
     def _compress(self) -> None:
         """
         Housekeeping method for combining RPeriods when necessary.
         """
-        index = 0
-        while index < len(self) - 1:
-            if self[index].value == self[index + 1].value:
-                self[index].repeat += self[index + 1].repeat
-                del self[index + 1]
+        # two-pointer compaction: merge runs in place behind a write
+        # index, then truncate once; a single list bypass (rather than
+        # del self[...]) avoids re-entering __delitem__/_compress per
+        # merged period
+        write = 0
+        for read in range(1, len(self)):
+            if self[read].value == self[write].value:
+                self[write].repeat += self[read].repeat
             else:
-                index += 1
+                write += 1
+                if write != read:
+                    list.__setitem__(self, write, self[read])
+        if self:
+            list.__delitem__(self, slice(write + 1, None))
 
     def extend(self, periods: Iterable[RPeriodLike]) -> None:
         """
@@ -493,6 +603,18 @@ class PNumber(list):
         """
         self.__setitem__(slice(index, index), [period, ])
 
+    def copy(self) -> 'PNumber':
+        """
+        Get a structural copy of this PNumber.
+
+        Returns:
+            A new PNumber with copies of this PNumber's RPeriods,
+            avoiding the str() round-trip through the period parser.
+        """
+        duplicate = PNumber(self)
+        duplicate.debug = self.debug
+        return duplicate
+
     def inject(self, zillion: int, period: RPeriodLike) -> None:
         """
         Inject the given period at a specific zillion value.
@@ -538,15 +660,21 @@ class PNumber(list):
                 f"{self} is very large! Integer approximation may be costly!",
                 ResourceWarning)
 
-        result = ""
+        # accumulate numerically in base 1000 instead of materializing
+        # a decimal string and parsing it back; r repeats of a period
+        # are the base-1000 repunit (1000**r - 1) // 999 scaled by the
+        # period value
+        result = 0
         exponent = max(0, self.num_periods - num_periods)
         for value, repeat in self:
-            result += str(value).zfill(3) * min(repeat, num_periods)
+            taken = min(repeat, num_periods)
+            power = 1000 ** taken
+            result = result * power + value * ((power - 1) // 999)
             num_periods -= repeat
             if num_periods <= 0:
                 break
 
-        return int(result or 0) * 1000 ** exponent
+        return result * 1000 ** exponent
 
 
 class RPeriod:
@@ -554,6 +682,10 @@ class RPeriod:
     Basic container for a repeated period.
     """
 
+    # no per-instance __dict__; million-period PNumbers allocate one
+    # RPeriod per run, so the fixed slot layout matters
+    __slots__ = ("__value", "__repeat", "_owner")
+
     def __init__(self, value: RPeriodLike, repeat: int = 1):
         """
         One or more consecutive periods in a number with the same value
@@ -580,6 +712,7 @@ class RPeriod:
         """
         self.__value: int = 0
         self.__repeat: int = 0
+        self._owner = None
 
         if not isinstance(value, int):
             self.value, self.repeat = value
@@ -587,6 +720,26 @@ class RPeriod:
             self.value = value
             self.repeat = repeat
 
+    @classmethod
+    def _unchecked_new(cls, value: int, repeat: int = 1) -> 'RPeriod':
+        """
+        Construct an RPeriod without setter validation.
+
+        Only for internal callers that already hold a known-valid value
+        and repeat (e.g. a base-1000 digit from rebase or a capture
+        from PERIOD_PATTERN); skipping the property machinery makes
+        bulk construction substantially cheaper.
+
+        Args:
+            value: A valid period value in the range [0, 1000).
+            repeat: Number of times this period repeats.
+        """
+        period = cls.__new__(cls)
+        period.__value = value
+        period.__repeat = repeat
+        period._owner = None
+        return period
+
     def __iter__(self) -> Generator[int, None, None]:
         yield self.value
         yield self.repeat
@@ -598,9 +751,9 @@ class RPeriod:
         if self.repeat < 1:
             return ""
         if self.repeat == 1:
-            return str(self.value).zfill(3)
+            return _PERIOD_STRINGS[self.value]
         if self.repeat > 1:
-            return f"[{str(self.value).zfill(3)}]{{{self.repeat}}}"
+            return f"[{_PERIOD_STRINGS[self.value]}]{{{self.repeat}}}"
 
     @staticmethod
     def check_value(value: int) -> None:
@@ -683,6 +836,7 @@ class RPeriod:
         """
         RPeriod.check_value(value)
         self.__value = value
+        self._notify()
 
     @property
     def repeat(self) -> int:
@@ -698,3 +852,20 @@ class RPeriod:
         """
         RPeriod.check_repeat(repeat)
         self.__repeat = repeat
+        self._notify()
+
+    def _notify(self) -> None:
+        """
+        Housekeeping method invalidating the owning PNumber's cached
+        attributes; called whenever value or repeat is set.
+        """
+        owner = self._owner() if self._owner is not None else None
+        if owner is not None:
+            owner._invalidate()
+
+
+_SMALL_PNUMBERS = tuple(PNumber(value) for value in range(100))
+"""
+Interned PNumbers for small non-negative ints; read-only equivalents
+for the int comparisons in _first/_last guard clauses.
+"""
@@ -16,11 +16,11 @@ from typing import (
     get_args as _get_args)
 
 # external
+import sys as _sys
 import argparse as _argparse
-from time import sleep as _sleep
 from pathlib import Path as _Path
 from itertools import cycle as _cycle
-from threading import Thread as _Thread
+from threading import Event as _Event, Thread as _Thread
 
 # internal
 from four import _oo_api, _fp_api
@@ -46,7 +46,8 @@ class _Spinner:
         """
         self.cycle = _cycle(cycle)
         self.delay = float(delay)
-        self._busy = False
+        self._stopped = _Event()
+        self._thread = None
 
     def __enter__(self):
         # To support usage as context manager
@@ -62,23 +63,28 @@ class _Spinner:
         """
         Target for threading.Thread.
         """
-        while self._busy:
+        while not self._stopped.is_set():
             string = next(self.cycle)
             print(string, end="\b" * len(string), flush=True)
-            _sleep(self.delay)
+            # interruptible sleep so stop() takes effect immediately
+            self._stopped.wait(self.delay)
 
     def start(self) -> None:
         """
         Start printing spinner to stdout in separate thread.
         """
-        self._busy = True
-        _Thread(target=self._spin).start()
+        self._stopped.clear()
+        self._thread = _Thread(target=self._spin, daemon=True)
+        self._thread.start()
 
     def stop(self) -> None:
         """
         Stop printing spinner to stdout in separate thread.
         """
-        self._busy = False
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
 
 
 def _iter_first_chain(
@@ -120,13 +126,24 @@ def _iter_first_chain(
             f"{api} module has no _first() function for defining a"
             f" 4-chain generator")
 
-    number = _fp_api.parse_abbreviation(root)
-    yield _fp_api.write_abbreviation(number)
+    # keep numbers in the api's native representation and format only
+    # when yielding; round-tripping every step through the fp parser
+    # converts representations twice per chain element for nothing
+    parse, write = (
+        (api.PNumber, lambda number: str(number) or "0")
+        if hasattr(api, "PNumber")
+        else (_fp_api.parse_abbreviation, _fp_api.write_abbreviation))
+
+    number = parse(root)
+    yield write(number)
 
     count = 1
     while count < length:
         number = api._first(number) # noqa
-        yield _fp_api.write_abbreviation(number)
+        if number is None:
+            # no number has a name of the target length
+            break
+        yield write(number)
         count += 1
 
 
@@ -148,9 +165,9 @@ def _print_first_chain(
     if hasattr(module, "_cli_verbosity"):
         module._cli_verbosity = int(verbosity)
 
-    # show we're thinking...
+    # show we're thinking... (unless output is piped)
     spinner = _Spinner()
-    if verbosity < 2:
+    if verbosity < 2 and _sys.stdout.isatty():
         spinner.start()
 
     try:
@@ -181,9 +198,10 @@ def _chain(length: int, chain_index: int, module: ModuleType, verbosity: int = 0
     if hasattr(module, "_cli_verbosity"):
         module._cli_verbosity = int(verbosity)
 
-    # show we're thinking...
+    # show we're thinking... (unless output is piped)
     spinner = _Spinner()
-    spinner.start()
+    if _sys.stdout.isatty():
+        spinner.start()
 
     try:
         if hasattr(module, "C"):
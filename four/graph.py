@@ -72,8 +72,15 @@ def _graph(
             exit()
 
     graph.node(name=str(root), label=f"<<B>{root}</B>>")
+    # many numbers share a name length, so build each target node
+    # string once instead of once per edge
+    targets = {}
     for n in (PNumber(i) for i in range(int(limit) + 1)):
-        graph.edge(str(n) or "0", str(n.name_length))
+        length = n.name_length_int
+        target = targets.get(length)
+        if target is None:
+            target = targets[length] = str(PNumber(length))
+        graph.edge(str(n) or "0", target)
 
     if output is not None:
         graph.format = output.suffix.lstrip(".")
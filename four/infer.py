@@ -17,10 +17,8 @@ from typing import (
 import numpy as _numpy
 import argparse as _argparse
 from pathlib import Path as _Path
-from functools import wraps as _wraps
-from decimal import Decimal as _Decimal
+from functools import wraps as _wraps, lru_cache as _lru_cache
 from scipy.optimize import curve_fit as _curve_fit
-from matplotlib import pyplot as _plt
 
 # internal
 from four._oo_api import PNumber, PNumberLike
@@ -113,22 +111,39 @@ Example:
 """
 
 
-def _iter_x_as_period_lists(
-        X: Iterable[PNumberLike] # noqa
-) -> Generator['PNumber', None, None]:
+@_lru_cache(maxsize=None)
+def _exact_target(num_periods: int) -> int:
     """
-    Iterate over each value x in X and yield x as a PNumber.
+    The exact value of the canonical target with the given number of
+    periods (373 in every period). Cached because curve_fit evaluates
+    the prediction functions on the same training points once per
+    iteration; the conversion only needs to happen once per point.
 
     Args:
-        X: Values to cast to PNumbers.
+        num_periods: Number of periods in the target number.
 
-    Yields:
-        PNumber: Each value in X cast to a PNumber.
+    Returns:
+        int: The exact value of the target number.
     """
-    yield from (
-        number if isinstance(number, PNumber)
-        else PNumber("373" * int(number) or 0)
-        for number in X)
+    # 373 in every period is a repunit in base 1000 scaled by 373;
+    # building the int directly skips two O(num_periods) string passes
+    return 373 * (1000 ** num_periods - 1) // 999
+
+
+@_lru_cache(maxsize=None)
+def _quick_target(num_periods: int) -> int:
+    """
+    The value of the canonical target with the given number of periods
+    (373 in every period) approximated by its leading period. Cached
+    for the same reason as :func:`_exact_target`.
+
+    Args:
+        num_periods: Number of periods in the target number.
+
+    Returns:
+        int: Approximation for the value of the target number.
+    """
+    return 373 * 1000 ** (num_periods - 1) if num_periods else 0
 
 
 def iter_exact_targets(
@@ -152,8 +167,9 @@ def iter_exact_targets(
         int: The Exact value of each PNumber in X.
     """
     yield from (
-        int(periods)
-        for periods in _iter_x_as_period_lists(X))
+        int(number) if isinstance(number, PNumber)
+        else _exact_target(int(number))
+        for number in X)
 
 
 def iter_quick_targets(
@@ -173,8 +189,9 @@ def iter_quick_targets(
         int: Approximation for the value of each PNumber in X.
     """
     yield from (
-        periods.approximate(num_periods=1)
-        for periods in _iter_x_as_period_lists(X))
+        number.approximate(num_periods=1) if isinstance(number, PNumber)
+        else _quick_target(int(number))
+        for number in X)
 
 
 @metadata(equation_template="F(x) ≈ x / {}")
@@ -296,8 +313,8 @@ def prototype_predict(
     Returns:
         List[float]: Predictions for each target length x in X.
     """
-    an, ad = _Decimal(a).as_integer_ratio()
-    bn, bd = _Decimal(b).as_integer_ratio()
+    an, ad = a.as_integer_ratio()
+    bn, bd = b.as_integer_ratio()
 
     def get_n_root(n, t) -> int:
         ...  # todo...
@@ -331,7 +348,9 @@ def _infer(
         function: Ignore use_integer_math and approximate_targets and
             use custom predictive function instead; default None.
     """
-    train_y = _numpy.array(LENGTH_PERIODS_TO_TARGET_PERIODS)
+    # bigint period counts overflow int64, so request float64 up front
+    # instead of letting numpy fall back to a slow object array
+    train_y = _numpy.array(LENGTH_PERIODS_TO_TARGET_PERIODS, dtype=float)
     train_x = _numpy.arange(len(train_y), dtype=int)
 
     func = function or {
@@ -343,8 +362,7 @@ def _infer(
 
     # floats required for training but not prediction
     train_func = _wraps(func)(
-        lambda *args: _numpy.array([
-            float(int(n)) for n in func(*args)]))
+        lambda *args: _numpy.asarray(func(*args), dtype=float))
 
     popt, *_ = _curve_fit(train_func, train_x, train_y)
     if use_integer_math:
@@ -358,6 +376,10 @@ def _infer(
               f" letter name is ≈[373]{{{tnp}}}")
 
     if graph_result:
+        # deferred so non-graphing invocations (and modules that
+        # import four.infer for its predictors) never pay for pyplot
+        from matplotlib import pyplot as _plt
+
         for target in targets:
             if target.num_periods > _NUM_PERIODS_LIMIT:
                 print(f"{target} may be too large to graph!")
@@ -5,6 +5,18 @@ from matplotlib import pyplot as plt
 from four import infer
 
 
+POWERS_OF_1000 = [1]
+
+
+def pow1000(exponent):
+    # curve_fit re-evaluates these models dozens of times over the
+    # same x values; grow the power table once instead of redoing the
+    # bignum pow per element per iteration
+    while len(POWERS_OF_1000) <= exponent:
+        POWERS_OF_1000.append(POWERS_OF_1000[-1] * 1000)
+    return POWERS_OF_1000[exponent]
+
+
 def integer_exact(x, a):
     return np.array([
         float(('373' * int(i)) or 0.0) / a
@@ -13,7 +25,7 @@ def integer_exact(x, a):
 
 def integer_approx(x, a):
     return np.array([
-        float(373 * (1000 ** int(i))) / a
+        float(373 * pow1000(int(i))) / a
         for i in x])
 
 
@@ -25,7 +37,7 @@ def float_exact(x, a, b):
 
 def float_approx(x, a, b):
     return np.array([
-        a * (float(373 * (1000 ** int(i))) ** b)
+        a * (float(373 * pow1000(int(i))) ** b)
         for i in x])
 
 
@@ -43,7 +55,7 @@ if __name__ == '__main__':
         axis = ax[divmod(index, 2)]
         pivot = len(ydata)
 
-        popt, *_ = curve_fit(func, xdata[:pivot], ydata, full_output=True)
+        popt, *_ = curve_fit(func, xdata[:pivot], ydata)
         predictions = func(xdata, *popt)
         error = abs(predictions[:pivot] - ydata)
 